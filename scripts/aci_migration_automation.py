@@ -8,7 +8,9 @@ and validation procedures.
 
 Classes:
     ACIConnector: Handles APIC API connections and operations
+    AsyncACIConnector: Issues concurrent APIC requests with asyncio
     NexusConfigParser: Parses existing Nexus configurations
+    ParsedCache: Caches parsed Nexus configurations on disk
     MigrationValidator: Validates migration steps and configurations
     TenantManager: Manages ACI tenant operations
     
@@ -19,14 +21,50 @@ Functions:
     generate_migration_report(): Creates migration status reports
 """
 
+import asyncio
 import requests
 import json
 import csv
+import hashlib
+import io
 import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import urllib3
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# httpx is only needed by AsyncACIConnector
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Prefer orjson for APIC payloads; fall back to the standard library
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Failures an APIC call can hit: transport errors and malformed responses.
+# Anything else is a bug and is left to propagate.
+RESPONSE_ERRORS = (KeyError, IndexError, ValueError)
+APIC_ERRORS = (requests.RequestException,) + RESPONSE_ERRORS
+ASYNC_APIC_ERRORS = ((httpx.HTTPError,) if httpx else ()) + RESPONSE_ERRORS
 
 # Disable SSL warnings for lab environments
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -42,6 +80,168 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# APIC login tokens shared across connector instances, keyed by (apic_ip, username,
+# password digest) so only the exact credentials that logged in reuse a token, and
+# holding (token, expiry timestamp). APIC tokens expire after 600s by default.
+_TOKEN_CACHE: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+TOKEN_CACHE_TTL = 540
+TOKEN_REFRESH_MARGIN = 30
+
+# Retry policy for transient APIC failures, shared by both connectors
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (502, 503, 504)
+
+# Migration mapping fields and the CSV columns they are read from
+MAPPING_COLUMNS = (
+    ('vlan_name', 'VLAN_Name'),
+    ('tenant', 'ACI_Tenant'),
+    ('app_profile', 'ACI_Application_Profile'),
+    ('epg', 'ACI_EPG'),
+    ('bridge_domain', 'ACI_Bridge_Domain'),
+    ('subnet', 'Subnet'),
+    ('priority', 'Migration_Priority'),
+    ('notes', 'Notes')
+)
+
+# EPG distinguished names per fvAEPg class query, keeping post-migration
+# lookups well under APIC and proxy URL length limits
+EPG_QUERY_CHUNK_SIZE = 50
+
+# Parsed Nexus configs are cached next to the configs; bump the version
+# whenever the parser output changes so stale caches are discarded
+PARSED_CACHE_FILE = '.parsed_cache'
+PARSED_CACHE_VERSION = 4
+
+# Above this many config files, parsing is spread across worker processes
+PARALLEL_PARSE_THRESHOLD = 4
+
+
+def _epg_dn(tenant: str, app_profile: str, epg: str) -> str:
+    """Return the distinguished name of an EPG."""
+    return f"uni/tn-{tenant}/ap-{app_profile}/epg-{epg}"
+
+
+def _parse_mp_context():
+    """
+    Return the multiprocessing context for parse workers.
+    
+    Forking copies held locks, which can deadlock when parsing is started from a
+    worker thread, so the fork server is used where the platform has one.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context()
+
+
+def _token_cache_key(apic_ip: str, username: str, password: str) -> Tuple[str, str, str]:
+    """Return the _TOKEN_CACHE key for a set of credentials."""
+    return apic_ip, username, hashlib.sha256(password.encode('utf-8')).hexdigest()
+
+
+# Request building and response handling shared by ACIConnector and
+# AsyncACIConnector, so the two differ only in how requests are sent. Each
+# connector provides _set_token() to apply or clear the login cookie.
+
+def _login_payload(username: str, password: str) -> Dict:
+    """Return the aaaLogin request body for a set of credentials."""
+    return {
+        "aaaUser": {
+            "attributes": {
+                "name": username,
+                "pwd": password
+            }
+        }
+    }
+
+
+def _reuse_cached_token(connector) -> bool:
+    """
+    Apply a cached token for the connector's credentials if it is still valid.
+    
+    Args:
+        connector: ACIConnector or AsyncACIConnector to apply the token to
+    
+    Returns:
+        bool: True if a cached token was applied, False if a login is needed
+    """
+    cached = _TOKEN_CACHE.get(_token_cache_key(connector.apic_ip, connector.username, connector.password))
+    if cached and cached[1] > time.time() + TOKEN_REFRESH_MARGIN:
+        connector._set_token(cached[0])
+        logger.info("Reusing cached APIC token for %s", connector.apic_ip)
+        return True
+    return False
+
+
+def _handle_login_response(connector, response) -> bool:
+    """
+    Apply and cache the token from an aaaLogin response.
+    
+    Args:
+        connector: ACIConnector or AsyncACIConnector that sent the login
+        response: requests or httpx response to the aaaLogin request
+    
+    Returns:
+        bool: True if authentication successful, False otherwise
+    """
+    if response.status_code != 200:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Authentication failed: %s - %s", response.status_code, response.text[:512])
+        return False
+    
+    token = _loads(response.content)['imdata'][0]['aaaLogin']['attributes']['token']
+    connector._set_token(token)
+    _TOKEN_CACHE[_token_cache_key(connector.apic_ip, connector.username, connector.password)] = (
+        token, time.time() + TOKEN_CACHE_TTL
+    )
+    logger.info("Successfully authenticated to APIC %s", connector.apic_ip)
+    return True
+
+
+def _invalidate_token(connector) -> None:
+    """Drop the connector's token, locally and from the shared cache."""
+    _TOKEN_CACHE.pop(_token_cache_key(connector.apic_ip, connector.username, connector.password), None)
+    connector._set_token(None)
+
+
+def _check_response(connector, response, action: str, *args) -> bool:
+    """
+    Check that an APIC request succeeded, logging the failure otherwise.
+    
+    A 403 means APIC rejected the token, so it is dropped and the next
+    authenticate() logs in again instead of reusing it.
+    
+    Args:
+        connector: ACIConnector or AsyncACIConnector that sent the request
+        response: requests or httpx response from APIC
+        action (str): What was attempted, as a %-format string for the log
+            (e.g., 'create EPG %s')
+        *args: Arguments for action
+    
+    Returns:
+        bool: True on a 200 or 201 response, False otherwise
+    """
+    if response.status_code in (200, 201):
+        return True
+    if response.status_code == 403:
+        _invalidate_token(connector)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(f"Failed to {action}: %s - %s", *args, response.status_code, response.text[:512])
+    return False
+
+
+def _tenant_page_url(base_url: str, tenant_name: str, prop_include: str, page_size: int, page: int) -> str:
+    """Return the URL of one page of a tenant subtree query."""
+    return (
+        f"{base_url}/mo/uni/tn-{tenant_name}.json?query-target=subtree"
+        f"&rsp-prop-include={prop_include}&page-size={page_size}&page={page}"
+    )
+
+
+def _bulk_tenant_payload(tenant_configs: List[Dict]) -> Dict:
+    """Return a polUni payload creating every tenant in tenant_configs."""
+    return {'polUni': {'attributes': {}, 'children': list(tenant_configs)}}
+
 
 class ACIConnector:
     """
@@ -49,9 +249,13 @@ class ACIConnector:
     
     This class provides methods for authenticating with APIC, sending API requests,
     and managing ACI configurations during the migration process.
+    
+    All requests share one pooled keep-alive session. Call close() when done, or
+    use the connector as a context manager, to release the pooled connections.
     """
     
-    def __init__(self, apic_ip: str, username: str, password: str, verify_ssl: bool = False):
+    def __init__(self, apic_ip: str, username: str, password: str, verify_ssl: bool = False,
+                 pool_size: int = 32):
         """
         Initialize ACI connector with APIC credentials.
         
@@ -60,6 +264,7 @@ class ACIConnector:
             username (str): APIC username
             password (str): APIC password  
             verify_ssl (bool): Whether to verify SSL certificates
+            pool_size (int): Maximum number of pooled connections to APIC
         """
         self.apic_ip = apic_ip
         self.username = username
@@ -67,70 +272,110 @@ class ACIConnector:
         self.verify_ssl = verify_ssl
         self.base_url = f"https://{apic_ip}/api"
         self.session = requests.Session()
+        self.session.verify = verify_ssl
+        self.session.headers.update({'Connection': 'keep-alive'})
+        
+        # Reuse TLS connections across calls and retry transient APIC errors
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
         self.token = None
+    
+    def __enter__(self) -> 'ACIConnector':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
         
     def authenticate(self) -> bool:
         """
         Authenticate with APIC and obtain session token.
         
+        A token cached by an earlier login with the same APIC credentials is reused
+        while it is still valid, skipping the aaaLogin round trip.
+        
         Returns:
             bool: True if authentication successful, False otherwise
         """
-        login_data = {
-            "aaaUser": {
-                "attributes": {
-                    "name": self.username,
-                    "pwd": self.password
-                }
-            }
-        }
+        if _reuse_cached_token(self):
+            return True
         
         try:
-            response = self.session.post(
-                f"{self.base_url}/aaaLogin.json",
-                json=login_data,
-                verify=self.verify_ssl,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                self.token = result['imdata'][0]['aaaLogin']['attributes']['token']
-                logger.info(f"Successfully authenticated to APIC {self.apic_ip}")
-                return True
-            else:
-                logger.error(f"Authentication failed: {response.status_code} - {response.text}")
-                return False
+            response = self._post(f"{self.base_url}/aaaLogin.json", _login_payload(self.username, self.password))
+            return _handle_login_response(self, response)
                 
-        except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
+        except APIC_ERRORS as e:
+            logger.error("Authentication error: %s", e)
             return False
     
-    def get_tenant_config(self, tenant_name: str) -> Optional[Dict]:
+    def _post(self, url: str, payload: Dict, timeout: int = 30) -> requests.Response:
+        """POST a JSON payload to APIC on the shared session."""
+        return self.session.post(
+            url,
+            data=_dumps(payload),
+            headers={'Content-Type': 'application/json'},
+            timeout=timeout
+        )
+    
+    def _set_token(self, token: Optional[str]) -> None:
+        """Send token with later requests, or stop sending one when None."""
+        self.token = token
+        if token:
+            self.session.headers['Cookie'] = f'APIC-cookie={token}'
+        else:
+            self.session.headers.pop('Cookie', None)
+    
+    def get_tenant_config(self, tenant_name: str, prop_include: str = 'config-only',
+                          page_size: int = 10000) -> Optional[Dict]:
         """
         Retrieve tenant configuration from APIC.
         
+        The tenant subtree is fetched page by page and only the properties selected
+        by prop_include are returned, which keeps responses small. Pass
+        prop_include='all' when the full object state is needed.
+        
         Args:
             tenant_name (str): Name of the tenant to retrieve
+            prop_include (str): APIC rsp-prop-include value ('config-only',
+                'naming-only' or 'all')
+            page_size (int): Number of objects requested per page
             
         Returns:
             Dict: Tenant configuration or None if not found
         """
+        imdata = []
+        page = 0
+        
         try:
-            response = self.session.get(
-                f"{self.base_url}/mo/uni/tn-{tenant_name}.json?query-target=subtree",
-                verify=self.verify_ssl,
-                timeout=30
-            )
+            while True:
+                response = self.session.get(
+                    _tenant_page_url(self.base_url, tenant_name, prop_include, page_size, page),
+                    timeout=30
+                )
             
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"Failed to get tenant {tenant_name}: {response.status_code}")
-                return None
+                if not _check_response(self, response, 'get tenant %s', tenant_name):
+                    return None
                 
-        except Exception as e:
-            logger.error(f"Error retrieving tenant {tenant_name}: {str(e)}")
+                page_data = _loads(response.content)['imdata']
+                imdata.extend(page_data)
+                if len(page_data) < page_size:
+                    return {'totalCount': str(len(imdata)), 'imdata': imdata}
+                page += 1
+                
+        except APIC_ERRORS as e:
+            logger.error("Error retrieving tenant %s: %s", tenant_name, e)
             return None
     
     def create_tenant(self, tenant_config: Dict) -> bool:
@@ -144,24 +389,110 @@ class ACIConnector:
             bool: True if creation successful, False otherwise
         """
         try:
-            response = self.session.post(
-                f"{self.base_url}/mo/uni.json",
-                json=tenant_config,
-                verify=self.verify_ssl,
-                timeout=60
-            )
+            response = self._post(f"{self.base_url}/mo/uni.json", tenant_config, timeout=60)
             
-            if response.status_code in [200, 201]:
-                logger.info(f"Successfully created tenant configuration")
+            if _check_response(self, response, 'create tenant'):
+                logger.info("Successfully created tenant configuration")
                 return True
-            else:
-                logger.error(f"Failed to create tenant: {response.status_code} - {response.text}")
-                return False
+            return False
                 
-        except Exception as e:
-            logger.error(f"Error creating tenant: {str(e)}")
+        except APIC_ERRORS as e:
+            logger.error("Error creating tenant: %s", e)
             return False
     
+    def create_tenants_bulk(self, tenant_configs: List[Dict]) -> Optional[int]:
+        """
+        Create several tenants in ACI fabric with a single polUni POST.
+        
+        Args:
+            tenant_configs (List[Dict]): Tenant configurations in JSON format
+        
+        Returns:
+            Optional[int]: HTTP status code from APIC, or None if the request failed
+        """
+        try:
+            response = self._post(f"{self.base_url}/mo/uni.json", _bulk_tenant_payload(tenant_configs), timeout=120)
+        
+            if _check_response(self, response, 'create tenants'):
+                logger.info("Successfully created %d tenant configurations", len(tenant_configs))
+            return response.status_code
+        
+        except APIC_ERRORS as e:
+            logger.error("Error creating tenants: %s", e)
+            return None
+    
+    def create_epg(self, tenant: str, app_profile: str, epg: str, bridge_domain: str,
+                   description: str = '') -> bool:
+        """
+        Create an EPG bound to a bridge domain in ACI fabric.
+        
+        Args:
+            tenant (str): Tenant the EPG belongs to
+            app_profile (str): Application profile the EPG belongs to
+            epg (str): EPG name
+            bridge_domain (str): Bridge domain the EPG is associated with
+            description (str): EPG description
+        
+        Returns:
+            bool: True if creation successful, False otherwise
+        """
+        dn = _epg_dn(tenant, app_profile, epg)
+        epg_config = {
+            'fvAEPg': {
+                'attributes': {'dn': dn, 'name': epg, 'descr': description},
+                'children': [{'fvRsBd': {'attributes': {'tnFvBDName': bridge_domain}}}]
+            }
+        }
+        
+        try:
+            response = self._post(f"{self.base_url}/mo/{dn}.json", epg_config)
+            
+            if _check_response(self, response, 'create EPG %s', dn):
+                logger.info("Successfully created EPG %s", dn)
+                return True
+            return False
+        
+        except APIC_ERRORS as e:
+            logger.error("Error creating EPG %s: %s", dn, e)
+            return False
+    
+    def get_many(self, class_name: str, filters: Optional[List[str]] = None,
+                 subtree: Optional[List[str]] = None) -> Optional[List[Dict]]:
+        """
+        Retrieve all objects of an APIC class with a single class query.
+        
+        Args:
+            class_name (str): APIC class to query (e.g., "fvAEPg")
+            filters (List[str]): Filter expressions combined with and()
+                (e.g., ['eq(fvAEPg.name,"Web-EPG")'])
+            subtree (List[str]): Child objects to embed via rsp-subtree-include
+                (e.g., ['health', 'fault-count'])
+        
+        Returns:
+            List[Dict]: Matching objects from imdata or None on error
+        """
+        params = []
+        if filters:
+            filter_expr = filters[0] if len(filters) == 1 else f"and({','.join(filters)})"
+            params.append(f"query-target-filter={filter_expr}")
+        if subtree:
+            params.append(f"rsp-subtree-include={','.join(subtree)}")
+        
+        url = f"{self.base_url}/class/{class_name}.json"
+        if params:
+            url += '?' + '&'.join(params)
+        
+        try:
+            response = self.session.get(url, timeout=30)
+            
+            if _check_response(self, response, 'query class %s', class_name):
+                return _loads(response.content)['imdata']
+            return None
+        
+        except APIC_ERRORS as e:
+            logger.error("Error querying class %s: %s", class_name, e)
+            return None
+    
     def validate_fabric_health(self) -> Dict:
         """
         Check ACI fabric health before migration.
@@ -178,32 +509,54 @@ class ACIConnector:
         }
         
         try:
-            # Check fabric nodes
-            nodes_response = self.session.get(
-                f"{self.base_url}/class/fabricNode.json",
-                verify=self.verify_ssl,
-                timeout=30
-            )
+            # Fetch fabric nodes (with embedded health and fault counts) and the
+            # fabric-wide critical fault count concurrently over pooled connections
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                nodes_future = executor.submit(
+                    self.get_many, 'fabricNode', subtree=['health', 'fault-count']
+                )
+                faults_future = executor.submit(
+                    self.get_many, 'faultInst',
+                    filters=['eq(faultInst.severity,"critical")'], subtree=['count']
+                )
+                nodes = nodes_future.result()
+                faults = faults_future.result()
             
-            if nodes_response.status_code == 200:
-                nodes_data = nodes_response.json()
-                health_status['total_nodes'] = len(nodes_data['imdata'])
+            # Without the node inventory the fabric state is unknown, not healthy
+            if nodes is None:
+                logger.error("Error checking fabric health: fabricNode query failed")
+                health_status['overall_health'] = 'error'
+                return health_status
                 
-                for node in nodes_data['imdata']:
-                    node_attrs = node['fabricNode']['attributes']
-                    if node_attrs['fabricSt'] == 'active':
-                        health_status['nodes_up'] += 1
+            health_status['total_nodes'] = len(nodes)
             
-            # Check critical faults
-            faults_response = self.session.get(
-                f"{self.base_url}/class/faultInst.json?query-target-filter=eq(faultInst.severity,\"critical\")",
-                verify=self.verify_ssl,
-                timeout=30
-            )
+            for node in nodes:
+                node_attrs = node['fabricNode']['attributes']
+                if node_attrs['fabricSt'] == 'active':
+                    health_status['nodes_up'] += 1
+            
+                node_details = {
+                    'name': node_attrs.get('name', ''),
+                    'state': node_attrs['fabricSt'],
+                    'health': None,
+                    'critical_faults': 0
+                }
+                for child in node['fabricNode'].get('children', []):
+                    if 'healthInst' in child:
+                        node_details['health'] = int(child['healthInst']['attributes']['cur'])
+                    elif 'faultCounts' in child:
+                        node_details['critical_faults'] = int(child['faultCounts']['attributes']['crit'])
             
-            if faults_response.status_code == 200:
-                faults_data = faults_response.json()
-                health_status['critical_faults'] = len(faults_data['imdata'])
+                health_status['details'].append(node_details)
+            
+            # Critical faults are counted fabric-wide, not only those raised on
+            # nodes; fall back to the per-node counts if that query failed
+            if faults is not None:
+                health_status['critical_faults'] = int(faults[0]['moCount']['attributes']['count'])
+            else:
+                health_status['critical_faults'] = sum(
+                    node['critical_faults'] for node in health_status['details']
+                )
             
             # Determine overall health
             if health_status['critical_faults'] == 0 and health_status['nodes_up'] == health_status['total_nodes']:
@@ -213,15 +566,389 @@ class ACIConnector:
             else:
                 health_status['overall_health'] = 'warning'
             
-            logger.info(f"Fabric health check completed: {health_status['overall_health']}")
+            logger.info("Fabric health check completed: %s", health_status['overall_health'])
             
-        except Exception as e:
-            logger.error(f"Error checking fabric health: {str(e)}")
+        except APIC_ERRORS as e:
+            logger.error("Error checking fabric health: %s", e)
             health_status['overall_health'] = 'error'
         
         return health_status
 
 
+class AsyncACIConnector:
+    """
+    Asynchronous counterpart of ACIConnector for fanning out APIC requests.
+    
+    Requests are issued from one httpx.AsyncClient over HTTP/2, so many concurrent
+    reads share a single connection instead of a thread per request. Requires the
+    optional httpx dependency (pip install 'httpx[http2]').
+    """
+    
+    def __init__(self, apic_ip: str, username: str, password: str, verify_ssl: bool = False,
+                 max_connections: int = 64):
+        """
+        Initialize asynchronous ACI connector with APIC credentials.
+        
+        Args:
+            apic_ip (str): APIC management IP address
+            username (str): APIC username
+            password (str): APIC password
+            verify_ssl (bool): Whether to verify SSL certificates
+            max_connections (int): Maximum number of concurrent connections to APIC
+        """
+        if httpx is None:
+            raise ImportError("AsyncACIConnector requires httpx: pip install 'httpx[http2]'")
+        
+        self.apic_ip = apic_ip
+        self.username = username
+        self.password = password
+        self.verify_ssl = verify_ssl
+        self.base_url = f"https://{apic_ip}/api"
+        self.client = httpx.AsyncClient(
+            http2=True,
+            verify=verify_ssl,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=30
+        )
+        self.token = None
+    
+    async def _request(self, method: str, url: str, **kwargs) -> 'httpx.Response':
+        """
+        Send a request to APIC, retrying transient failures with backoff.
+        
+        Mirrors ACIConnector's Retry policy: connection failures are retried for
+        every method, while read errors and 502/503/504 responses are retried
+        only for GETs, since a POST may already have been applied.
+        """
+        for attempt in range(RETRY_TOTAL + 1):
+            retries_left = attempt < RETRY_TOTAL
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if not retries_left or (method != 'GET' and not isinstance(e, httpx.ConnectError)):
+                    raise
+            else:
+                if not retries_left or method != 'GET' or response.status_code not in RETRY_STATUSES:
+                    return response
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+    
+    async def _post(self, url: str, payload: Dict, timeout: int = 30) -> 'httpx.Response':
+        """POST a JSON payload to APIC on the shared client."""
+        return await self._request(
+            'POST',
+            url,
+            content=_dumps(payload),
+            headers={'Content-Type': 'application/json'},
+            timeout=timeout
+        )
+    
+    async def __aenter__(self) -> 'AsyncACIConnector':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        await self.client.aclose()
+    
+    async def authenticate(self) -> bool:
+        """
+        Authenticate with APIC and obtain session token.
+        
+        Shares the token cache used by ACIConnector.
+        
+        Returns:
+            bool: True if authentication successful, False otherwise
+        """
+        if _reuse_cached_token(self):
+            return True
+        
+        try:
+            response = await self._post(f"{self.base_url}/aaaLogin.json", _login_payload(self.username, self.password))
+            return _handle_login_response(self, response)
+        
+        except ASYNC_APIC_ERRORS as e:
+            logger.error("Authentication error: %s", e)
+            return False
+    
+    def _set_token(self, token: Optional[str]) -> None:
+        """Send token with later requests, or stop sending one when None."""
+        self.token = token
+        if token:
+            self.client.headers['Cookie'] = f'APIC-cookie={token}'
+        else:
+            self.client.headers.pop('Cookie', None)
+    
+    async def get_tenant_config(self, tenant_name: str, prop_include: str = 'config-only',
+                                page_size: int = 10000) -> Optional[Dict]:
+        """
+        Retrieve tenant configuration from APIC.
+        
+        Args:
+            tenant_name (str): Name of the tenant to retrieve
+            prop_include (str): APIC rsp-prop-include value ('config-only',
+                'naming-only' or 'all')
+            page_size (int): Number of objects requested per page
+        
+        Returns:
+            Dict: Tenant configuration or None if not found
+        """
+        imdata = []
+        page = 0
+        
+        try:
+            while True:
+                response = await self._request(
+                    'GET', _tenant_page_url(self.base_url, tenant_name, prop_include, page_size, page)
+                )
+                
+                if not _check_response(self, response, 'get tenant %s', tenant_name):
+                    return None
+                
+                page_data = _loads(response.content)['imdata']
+                imdata.extend(page_data)
+                if len(page_data) < page_size:
+                    return {'totalCount': str(len(imdata)), 'imdata': imdata}
+                page += 1
+        
+        except ASYNC_APIC_ERRORS as e:
+            logger.error("Error retrieving tenant %s: %s", tenant_name, e)
+            return None
+    
+    async def get_tenants(self, tenant_names: List[str]) -> List[Optional[Dict]]:
+        """
+        Retrieve several tenant configurations concurrently.
+        
+        Args:
+            tenant_names (List[str]): Names of the tenants to retrieve
+        
+        Returns:
+            List[Dict]: Tenant configurations in the order requested, None for
+                tenants that could not be retrieved
+        """
+        return await asyncio.gather(*(self.get_tenant_config(name) for name in tenant_names))
+    
+    async def create_tenant(self, tenant_config: Dict) -> bool:
+        """
+        Create a new tenant in ACI fabric.
+        
+        Args:
+            tenant_config (Dict): Tenant configuration in JSON format
+        
+        Returns:
+            bool: True if creation successful, False otherwise
+        """
+        try:
+            response = await self._post(f"{self.base_url}/mo/uni.json", tenant_config, timeout=60)
+            
+            if _check_response(self, response, 'create tenant'):
+                logger.info("Successfully created tenant configuration")
+                return True
+            return False
+        
+        except ASYNC_APIC_ERRORS as e:
+            logger.error("Error creating tenant: %s", e)
+            return False
+    
+    async def create_tenants_bulk(self, tenant_configs: List[Dict]) -> Optional[int]:
+        """
+        Create several tenants in ACI fabric with a single polUni POST.
+        
+        Args:
+            tenant_configs (List[Dict]): Tenant configurations in JSON format
+        
+        Returns:
+            Optional[int]: HTTP status code from APIC, or None if the request failed
+        """
+        try:
+            response = await self._post(
+                f"{self.base_url}/mo/uni.json", _bulk_tenant_payload(tenant_configs), timeout=120
+            )
+        
+            if _check_response(self, response, 'create tenants'):
+                logger.info("Successfully created %d tenant configurations", len(tenant_configs))
+            return response.status_code
+        
+        except ASYNC_APIC_ERRORS as e:
+            logger.error("Error creating tenants: %s", e)
+            return None
+
+
+# Matches every Nexus config line the parser cares about; each alternative has
+# exactly one named group so match.lastgroup identifies the line type.
+# Alternatives are nested by shared prefix (indentation, then "switchport") so
+# the engine walks keywords like a trie instead of retrying each full pattern.
+# Top-level lines that are not recognised fall into 'section' and close the
+# current block, while unrecognised indented lines are skipped entirely.
+_NEXUS_RE = re.compile(
+    r'^(?:'
+    r'hostname[ \t]+(?P<hostname>\S+)'
+    r'|vlan[ \t]+(?P<vlan>[\d,\-]+)'
+    r'|interface[ \t]+(?P<interface>\S+)'
+    r'|(?P<section>[^!\s].*?)'
+    r'|[ \t]+(?:'
+        r'name[ \t]+(?P<name>.+?)'
+        r'|description[ \t]+(?P<description>.+?)'
+        r'|switchport[ \t]+(?:'
+            r'mode[ \t]+(?P<mode>\S+)'
+            r'|access[ \t]+vlan[ \t]+(?P<access_vlan>\d+)'
+            r'|trunk[ \t]+allowed[ \t]+vlan[ \t]+(?P<trunk_vlans>[\d,\-]+)'
+        r')'
+    r')'
+    r')[ \t]*\r?$',
+    re.MULTILINE
+)
+
+
+# One VLAN ID or range ("10" or "30-35") within a comma-separated VLAN list
+_VLAN_RANGE_RE = re.compile(r'(\d+)(?:-(\d+))?')
+
+
+def _handle_hostname(value: str, config_data: Dict, state: Dict) -> None:
+    config_data['hostname'] = value
+    state['section'] = None
+    state['interface'] = None
+
+
+def _handle_vlan(value: str, config_data: Dict, state: Dict) -> None:
+    vlan_ids = NexusConfigParser._parse_vlan_list(value)
+    state['section'] = 'vlan'
+    state['interface'] = None
+    state['vlan'] = vlan_ids[-1] if vlan_ids else None
+    config_data['vlans'].update({vlan_id: {'name': f'VLAN_{vlan_id}'} for vlan_id in vlan_ids})
+
+
+def _handle_vlan_name(value: str, config_data: Dict, state: Dict) -> None:
+    # Apply to the most recent VLAN
+    if state['section'] == 'vlan' and state['vlan']:
+        config_data['vlans'][state['vlan']]['name'] = value
+
+
+def _handle_interface(value: str, config_data: Dict, state: Dict) -> None:
+    state['section'] = 'interface'
+    state['interface'] = value
+    config_data['interfaces'][value] = {
+        'type': 'unknown',
+        'mode': 'access',
+        'vlans': [],
+        'description': ''
+    }
+
+
+def _interface_handler(field: str, convert=None):
+    """Build a handler that sets a field on the current interface."""
+    def handler(value: str, config_data: Dict, state: Dict) -> None:
+        if state['section'] == 'interface' and state['interface']:
+            config_data['interfaces'][state['interface']][field] = convert(value) if convert else value
+    return handler
+
+
+def _handle_section(value: str, config_data: Dict, state: Dict) -> None:
+    # Any other top-level command closes the current block
+    state['section'] = None
+    state['interface'] = None
+
+
+_NEXUS_HANDLERS = {
+    'hostname': _handle_hostname,
+    'vlan': _handle_vlan,
+    'name': _handle_vlan_name,
+    'interface': _handle_interface,
+    'description': _interface_handler('description'),
+    'mode': _interface_handler('mode'),
+    'access_vlan': _interface_handler('vlans', lambda vlan: [vlan]),
+    'trunk_vlans': _interface_handler('vlans', lambda vlans: NexusConfigParser._parse_vlan_list(vlans)),
+    'section': _handle_section
+}
+
+
+class ParsedCache:
+    """
+    On-disk cache of parsed Nexus configurations.
+    
+    Entries are keyed by config file name and stamped with the file's modification
+    time and size, so an entry is only reused while the file is unchanged. The
+    whole cache is invalidated when PARSED_CACHE_VERSION changes. The file is
+    plain JSON, so loading a cache never runs code from it.
+    """
+    
+    def __init__(self, cache_file: Path):
+        """
+        Initialize cache backed by the given file.
+        
+        Args:
+            cache_file (Path): Path of the JSON cache file
+        """
+        self.cache_file = Path(cache_file)
+        self.entries = self._load()
+    
+    def _load(self) -> Dict:
+        """Load cached entries, discarding unreadable or outdated caches."""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = _loads(f.read())
+            if not isinstance(data, dict) or data.get('version') != PARSED_CACHE_VERSION:
+                return {}
+            # JSON has no tuples, so file keys come back as lists
+            return {name: (tuple(key), config_data) for name, (key, config_data) in data['entries'].items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable parse cache {self.cache_file}: {str(e)}")
+            return {}
+    
+    @staticmethod
+    def _file_key(config_file: Path) -> Tuple[int, int]:
+        stat = config_file.stat()
+        return stat.st_mtime_ns, stat.st_size
+    
+    def is_current(self, config_file: Path) -> bool:
+        """
+        Check whether the cache holds results for the file as it is now.
+        
+        Args:
+            config_file (Path): Path to configuration file
+        
+        Returns:
+            bool: True if a cached entry matches the file's mtime and size
+        """
+        entry = self.entries.get(config_file.name)
+        return bool(entry) and entry[0] == self._file_key(config_file)
+    
+    def get(self, config_file: Path) -> Optional[Dict]:
+        """
+        Return cached parse results for a config file if it is unchanged.
+        
+        Args:
+            config_file (Path): Path to configuration file
+        
+        Returns:
+            Dict: Parsed configuration data or None if missing or stale
+        """
+        if self.is_current(config_file):
+            return self.entries[config_file.name][1]
+        return None
+    
+    def put(self, config_file: Path, config_data: Dict) -> None:
+        """
+        Store parse results for a config file.
+        
+        Args:
+            config_file (Path): Path to configuration file
+            config_data (Dict): Parsed configuration data
+        """
+        self.entries[config_file.name] = (self._file_key(config_file), config_data)
+    
+    def save(self) -> None:
+        """Write the cache to disk; failures only disable caching."""
+        try:
+            with open(self.cache_file, 'wb') as f:
+                f.write(_dumps({'version': PARSED_CACHE_VERSION, 'entries': self.entries}))
+        except OSError as e:
+            logger.warning(f"Could not write parse cache {self.cache_file}: {str(e)}")
+
+
 class NexusConfigParser:
     """
     Parses Nexus switch configurations to extract migration-relevant information.
@@ -230,33 +957,84 @@ class NexusConfigParser:
     routing protocols, and other settings that need to be migrated to ACI.
     """
     
-    def __init__(self, config_directory: str):
+    def __init__(self, config_directory: str, use_cache: bool = True):
         """
         Initialize parser with configuration directory.
         
         Args:
             config_directory (str): Path to directory containing Nexus configs
+            use_cache (bool): Whether to reuse parse results cached on disk
+                for config files that have not changed
         """
         self.config_dir = Path(config_directory)
+        self.use_cache = use_cache
         self.parsed_configs = {}
         
     def parse_all_configs(self) -> Dict:
         """
         Parse all Nexus configuration files in the directory.
         
+        Files whose modification time and size match the on-disk cache are
+        loaded from it instead of being parsed again.
+        
         Returns:
             Dict: Parsed configuration data organized by switch
         """
+        for switch_name, config_data in self.iter_parsed():
+            self.parsed_configs[switch_name] = config_data
+        
+        return self.parsed_configs
+    
+    def iter_parsed(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Parse Nexus configuration files one at a time.
+        
+        Unlike parse_all_configs, results are not kept on the parser, so callers
+        that only need a summary never hold every parsed config at once.
+        
+        Yields:
+            Tuple[str, Dict]: Switch name and its parsed configuration data
+        """
         config_files = list(self.config_dir.glob("*.cfg"))
         logger.info(f"Found {len(config_files)} configuration files to parse")
         
-        for config_file in config_files:
-            switch_name = config_file.stem
-            self.parsed_configs[switch_name] = self.parse_config_file(config_file)
-            
-        return self.parsed_configs
+        cache = ParsedCache(self.config_dir / PARSED_CACHE_FILE) if self.use_cache else None
+        stale_files = [
+            config_file for config_file in config_files
+            if not (cache and cache.is_current(config_file))
+        ]
+        
+        if cache and len(stale_files) < len(config_files):
+            logger.info(f"Loading {len(config_files) - len(stale_files)} unchanged configurations from cache")
+        
+        # Each file parses independently, so large sets are fanned out to worker
+        # processes; small sets are parsed inline to avoid process startup cost.
+        # Both produce results lazily, in file order.
+        with ExitStack() as stack:
+            if len(stale_files) > PARALLEL_PARSE_THRESHOLD:
+                max_workers = min(len(stale_files), os.cpu_count() or 1)
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=max_workers, mp_context=_parse_mp_context())
+                )
+                fresh = executor.map(self.parse_config_file, stale_files)
+            else:
+                fresh = map(self.parse_config_file, stale_files)
+        
+            stale = set(stale_files)
+            for config_file in config_files:
+                if config_file in stale:
+                    config_data = next(fresh)
+                    if cache:
+                        cache.put(config_file, config_data)
+                else:
+                    config_data = cache.get(config_file)
+                yield config_file.stem, config_data
+        
+        if cache and stale_files:
+            cache.save()
     
-    def parse_config_file(self, config_file: Path) -> Dict:
+    @staticmethod
+    def parse_config_file(config_file: Path) -> Dict:
         """
         Parse a single Nexus configuration file.
         
@@ -275,77 +1053,14 @@ class NexusConfigParser:
         }
         
         try:
-            with open(config_file, 'r') as f:
-                lines = f.readlines()
+            text = Path(config_file).read_text(encoding='utf-8', errors='replace')
             
-            current_section = None
-            current_interface = None
+            # Tracks the enclosing top-level block across matched lines
+            state = {'section': None, 'interface': None, 'vlan': None}
             
-            for line in lines:
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if line.startswith('!') or not line:
-                    continue
-                
-                # Parse hostname
-                if line.startswith('hostname'):
-                    config_data['hostname'] = line.split()[1]
-                
-                # Parse VLANs
-                elif line.startswith('vlan '):
-                    vlan_range = line.split()[1]
-                    current_section = 'vlan'
-                    if '-' in vlan_range:
-                        start, end = vlan_range.split('-')
-                        for vlan_id in range(int(start), int(end) + 1):
-                            config_data['vlans'][str(vlan_id)] = {'name': f'VLAN_{vlan_id}'}
-                    else:
-                        config_data['vlans'][vlan_range] = {'name': f'VLAN_{vlan_range}'}
-                
-                # Parse VLAN names
-                elif line.startswith('name ') and current_section == 'vlan':
-                    vlan_name = ' '.join(line.split()[1:])
-                    # Apply to the most recent VLAN
-                    if config_data['vlans']:
-                        last_vlan = list(config_data['vlans'].keys())[-1]
-                        config_data['vlans'][last_vlan]['name'] = vlan_name
-                
-                # Parse interfaces
-                elif line.startswith('interface '):
-                    interface_name = line.split()[1]
-                    current_interface = interface_name
-                    current_section = 'interface'
-                    config_data['interfaces'][interface_name] = {
-                        'type': 'unknown',
-                        'mode': 'access',
-                        'vlans': [],
-                        'description': ''
-                    }
-                
-                # Parse interface configurations
-                elif current_section == 'interface' and current_interface:
-                    if line.startswith('description '):
-                        description = ' '.join(line.split()[1:])
-                        config_data['interfaces'][current_interface]['description'] = description
-                    
-                    elif line.startswith('switchport mode'):
-                        mode = line.split()[-1]
-                        config_data['interfaces'][current_interface]['mode'] = mode
-                    
-                    elif line.startswith('switchport access vlan'):
-                        vlan = line.split()[-1]
-                        config_data['interfaces'][current_interface]['vlans'] = [vlan]
-                    
-                    elif line.startswith('switchport trunk allowed vlan'):
-                        vlans_str = ' '.join(line.split()[4:])
-                        vlans = self._parse_vlan_list(vlans_str)
-                        config_data['interfaces'][current_interface]['vlans'] = vlans
-                
-                # Reset section on new top-level command
-                elif not line.startswith(' ') and current_section:
-                    current_section = None
-                    current_interface = None
+            for match in _NEXUS_RE.finditer(text):
+                kind = match.lastgroup
+                _NEXUS_HANDLERS[kind](match.group(kind), config_data, state)
             
             logger.info(f"Parsed configuration for {config_data.get('hostname', 'unknown')}")
             
@@ -354,7 +1069,8 @@ class NexusConfigParser:
         
         return config_data
     
-    def _parse_vlan_list(self, vlan_string: str) -> List[str]:
+    @staticmethod
+    def _parse_vlan_list(vlan_string: str) -> List[str]:
         """
         Parse VLAN list from configuration line.
         
@@ -364,18 +1080,10 @@ class NexusConfigParser:
         Returns:
             List[str]: List of VLAN IDs
         """
-        vlans = []
-        parts = vlan_string.split(',')
-        
-        for part in parts:
-            part = part.strip()
-            if '-' in part:
-                start, end = part.split('-')
-                vlans.extend([str(i) for i in range(int(start), int(end) + 1)])
-            else:
-                vlans.append(part)
-        
-        return vlans
+        return list(chain.from_iterable(
+            map(str, range(int(start), int(end) + 1)) if end else (start,)
+            for start, end in _VLAN_RANGE_RE.findall(vlan_string)
+        ))
     
     def generate_migration_mapping(self, csv_file: str) -> Dict:
         """
@@ -390,19 +1098,22 @@ class NexusConfigParser:
         mapping = {}
         
         try:
-            with open(csv_file, 'r') as f:
-                reader = csv.DictReader(f)
+            with open(csv_file, 'r', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader)
+                
+                # Resolve column positions once so rows stay plain lists
+                vlan_col = header.index('Nexus_VLAN')
+                columns = [(field, header.index(column)) for field, column in MAPPING_COLUMNS]
+                
                 for row in reader:
-                    vlan_id = row['Nexus_VLAN']
-                    mapping[vlan_id] = {
-                        'vlan_name': row['VLAN_Name'],
-                        'tenant': row['ACI_Tenant'],
-                        'app_profile': row['ACI_Application_Profile'],
-                        'epg': row['ACI_EPG'],
-                        'bridge_domain': row['ACI_Bridge_Domain'],
-                        'subnet': row['Subnet'],
-                        'priority': row['Migration_Priority'],
-                        'notes': row['Notes']
+                    if len(row) <= vlan_col:
+                        continue
+                    # Short rows (trailing columns left off) get None for the
+                    # missing fields, as csv.DictReader would
+                    width = len(row)
+                    mapping[row[vlan_col]] = {
+                        field: row[index] if index < width else None for field, index in columns
                     }
             
             logger.info(f"Loaded migration mapping for {len(mapping)} VLANs")
@@ -421,16 +1132,20 @@ class MigrationValidator:
     verification, and ongoing monitoring during the migration process.
     """
     
-    def __init__(self, aci_connector: ACIConnector, nexus_parser: NexusConfigParser):
+    def __init__(self, aci_connector: ACIConnector, nexus_parser: NexusConfigParser,
+                 mapping_file: Optional[str] = None):
         """
         Initialize validator with ACI connector and Nexus parser.
         
         Args:
             aci_connector (ACIConnector): Connected ACI API instance
             nexus_parser (NexusConfigParser): Configured Nexus parser
+            mapping_file (str): Path to the VLAN-to-EPG mapping CSV; located
+                relative to the Nexus config directory when not given
         """
         self.aci = aci_connector
         self.nexus = nexus_parser
+        self._mapping_file = Path(mapping_file) if mapping_file else None
         self.validation_results = {}
         
     def pre_migration_check(self) -> Dict:
@@ -455,21 +1170,19 @@ class MigrationValidator:
             'details': fabric_health
         }
         
-        # Validate configuration parsing
-        parsed_configs = self.nexus.parse_all_configs()
+        # Parse configurations and check VLAN consistency across switches in one
+        # streaming pass, without holding every parsed config in memory
+        vlan_consistency = self._check_vlan_consistency(self.nexus.iter_parsed())
+        switch_count = vlan_consistency['details']['total_switches']
         results['checks']['config_parsing'] = {
-            'status': 'pass' if parsed_configs else 'fail',
-            'details': f"Parsed {len(parsed_configs)} configuration files"
+            'status': 'pass' if switch_count else 'fail',
+            'details': f"Parsed {switch_count} configuration files"
         }
-        
-        # Check VLAN consistency across switches
-        vlan_consistency = self._check_vlan_consistency(parsed_configs)
         results['checks']['vlan_consistency'] = vlan_consistency
         
         # Validate migration mapping
         try:
-            mapping_file = self.nexus.config_dir.parent / "configs/aci/migration-mappings/vlan-to-epg-mapping.csv"
-            migration_mapping = self.nexus.generate_migration_mapping(str(mapping_file))
+            migration_mapping = self.nexus.generate_migration_mapping(str(self.mapping_file()))
             results['checks']['migration_mapping'] = {
                 'status': 'pass' if migration_mapping else 'fail',
                 'details': f"Loaded mapping for {len(migration_mapping)} VLANs"
@@ -487,47 +1200,71 @@ class MigrationValidator:
         logger.info(f"Pre-migration validation completed: {results['overall_status']}")
         return results
     
-    def _check_vlan_consistency(self, parsed_configs: Dict) -> Dict:
+    def mapping_file(self) -> Path:
+        """
+        Return the path of the VLAN-to-EPG migration mapping CSV.
+        
+        Without an explicit path, the repository layout is assumed and the
+        Nexus config directory's ancestors are searched for the CSV, so both
+        configs/nexus and configs/nexus/current-state resolve.
+        """
+        if self._mapping_file is not None:
+            return self._mapping_file
+        
+        relative = Path("configs/aci/migration-mappings/vlan-to-epg-mapping.csv")
+        config_dir = self.nexus.config_dir.resolve()
+        for directory in (config_dir, *config_dir.parents):
+            candidate = directory / relative
+            if candidate.is_file():
+                self._mapping_file = candidate
+                return candidate
+        return self.nexus.config_dir.parent / relative
+    
+    def _check_vlan_consistency(self, parsed_configs: Union[Dict, Iterable[Tuple[str, Dict]]]) -> Dict:
         """
         Check VLAN consistency across all switches.
         
         Args:
-            parsed_configs (Dict): Parsed configuration data
+            parsed_configs: Parsed configuration data, either as a dict keyed by
+                switch or as (switch, config) pairs such as NexusConfigParser.iter_parsed()
             
         Returns:
             Dict: VLAN consistency check results
         """
-        all_vlans = set()
-        switch_vlans = {}
+        if isinstance(parsed_configs, dict):
+            parsed_configs = parsed_configs.items()
         
-        for switch_name, config in parsed_configs.items():
-            vlans = set(config['vlans'].keys())
-            switch_vlans[switch_name] = vlans
-            all_vlans.update(vlans)
+        # Invert to VLAN -> switches carrying it in a single pass
+        all_switches = set()
+        vlan_to_switches = {}
+        for switch_name, config in parsed_configs:
+            all_switches.add(switch_name)
+            for vlan in config['vlans']:
+                vlan_to_switches.setdefault(vlan, set()).add(switch_name)
         
-        inconsistent_vlans = []
-        for vlan in all_vlans:
-            switches_with_vlan = [switch for switch, vlans in switch_vlans.items() if vlan in vlans]
-            if len(switches_with_vlan) != len(parsed_configs):
-                inconsistent_vlans.append({
-                    'vlan': vlan,
-                    'missing_from': [switch for switch in parsed_configs.keys() if switch not in switches_with_vlan]
-                })
+        inconsistent_vlans = [
+            {'vlan': vlan, 'missing_from': sorted(all_switches - switches)}
+            for vlan, switches in vlan_to_switches.items()
+            if switches != all_switches
+        ]
         
         return {
             'status': 'pass' if not inconsistent_vlans else 'warning',
             'details': {
-                'total_vlans': len(all_vlans),
+                'total_switches': len(all_switches),
+                'total_vlans': len(vlan_to_switches),
                 'inconsistent_vlans': inconsistent_vlans
             }
         }
     
-    def post_migration_validation(self, migrated_vlans: List[str]) -> Dict:
+    def post_migration_validation(self, migrated_vlans: List[str], mapping: Optional[Dict] = None) -> Dict:
         """
         Validate successful migration of VLANs to EPGs.
         
         Args:
             migrated_vlans (List[str]): List of VLANs that should be migrated
+            mapping (Optional[Dict]): VLAN-to-EPG mapping already loaded by the
+                caller; read from mapping_file() when not given
             
         Returns:
             Dict: Post-migration validation results
@@ -542,14 +1279,50 @@ class MigrationValidator:
         
         logger.info(f"Starting post-migration validation for {len(migrated_vlans)} VLANs")
         
-        # Check if EPGs were created successfully
+        # Check if EPGs were created successfully. EPGs are matched on their full
+        # dn, so a same-named EPG in another tenant or app profile doesn't count,
+        # and fetched with a few chunked class queries instead of one per VLAN
+        if mapping is None:
+            mapping = self.nexus.generate_migration_mapping(str(self.mapping_file()))
+        epg_dns = {
+            vlan: _epg_dn(mapping[vlan]['tenant'], mapping[vlan]['app_profile'], mapping[vlan]['epg'])
+            for vlan in migrated_vlans if vlan in mapping
+        }
+        
+        existing_epgs = set()
+        unique_dns = list(dict.fromkeys(epg_dns.values()))
+        for start in range(0, len(unique_dns), EPG_QUERY_CHUNK_SIZE):
+            dn_filters = [f'eq(fvAEPg.dn,"{dn}")' for dn in unique_dns[start:start + EPG_QUERY_CHUNK_SIZE]]
+            filter_expr = dn_filters[0] if len(dn_filters) == 1 else f"or({','.join(dn_filters)})"
+            epgs = self.aci.get_many('fvAEPg', filters=[filter_expr])
+            
+            if epgs is None:
+                existing_epgs = None
+                break
+            existing_epgs.update(epg['fvAEPg']['attributes']['dn'] for epg in epgs)
+        
         for vlan in migrated_vlans:
-            # This would check if corresponding EPG exists in ACI
-            # Implementation depends on specific mapping logic
-            results['epg_status'][vlan] = {
-                'status': 'unknown',
-                'details': 'EPG validation not implemented'
-            }
+            epg_dn = epg_dns.get(vlan)
+            if epg_dn is None:
+                results['epg_status'][vlan] = {
+                    'status': 'unknown',
+                    'details': 'No EPG mapping found for VLAN'
+                }
+            elif existing_epgs is None:
+                results['epg_status'][vlan] = {
+                    'status': 'unknown',
+                    'details': f"Unable to query EPG {epg_dn} from APIC"
+                }
+            elif epg_dn in existing_epgs:
+                results['epg_status'][vlan] = {
+                    'status': 'pass',
+                    'details': f"EPG found at {epg_dn}"
+                }
+            else:
+                results['epg_status'][vlan] = {
+                    'status': 'fail',
+                    'details': f"EPG {epg_dn} not found in ACI"
+                }
         
         # Placeholder for connectivity tests
         results['connectivity_tests'] = {
@@ -558,7 +1331,8 @@ class MigrationValidator:
         }
         
         # Determine overall status
-        results['overall_status'] = 'pending'
+        failed_epgs = [vlan for vlan, epg in results['epg_status'].items() if epg['status'] == 'fail']
+        results['overall_status'] = 'fail' if failed_epgs else 'pending'
         
         logger.info("Post-migration validation completed")
         return results
@@ -572,31 +1346,31 @@ def generate_migration_report(validation_results: Dict, output_file: str) -> Non
         validation_results (Dict): Results from migration validation
         output_file (str): Path to output report file
     """
-    report_content = []
-    report_content.append("# ACI Migration Report")
-    report_content.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report_content.append("")
+    report = io.StringIO()
+    write = report.write
+    write("# ACI Migration Report\n")
+    write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    write("\n")
     
     # Overall status
     overall_status = validation_results.get('overall_status', 'unknown')
-    report_content.append(f"## Overall Status: {overall_status.upper()}")
-    report_content.append("")
+    write(f"## Overall Status: {overall_status.upper()}\n")
+    write("\n")
     
     # Detailed results
-    report_content.append("## Validation Results")
+    write("## Validation Results\n")
     for check_name, check_result in validation_results.get('checks', {}).items():
         status = check_result['status']
         details = check_result['details']
         
-        report_content.append(f"### {check_name.replace('_', ' ').title()}")
-        report_content.append(f"Status: {status.upper()}")
-        report_content.append(f"Details: {details}")
-        report_content.append("")
+        write(f"### {check_name.replace('_', ' ').title()}\n")
+        write(f"Status: {status.upper()}\n")
+        write(f"Details: {details}\n")
+        write("\n")
     
     # Write report to file
     try:
-        with open(output_file, 'w') as f:
-            f.write('\n'.join(report_content))
+        Path(output_file).write_text(report.getvalue())
         logger.info(f"Migration report saved to {output_file}")
     except Exception as e:
         logger.error(f"Error writing report: {str(e)}")
@@ -8,28 +8,114 @@ including pre-checks, configuration deployment, and validation.
 
 import sys
 import argparse
+import asyncio
+import functools
 import json
 import logging
+import mmap
+import os
+import queue
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 # Add the scripts directory to Python path for imports
 sys.path.append(str(Path(__file__).parent))
 
+if TYPE_CHECKING:
+    from aci_migration_automation import ACIConnector, NexusConfigParser
+
+# orjson parses tenant and config files considerably faster; fall back to
+# the standard library when it isn't installed
 try:
-    from aci_migration_automation import ACIConnector, NexusConfigParser, MigrationValidator, generate_migration_report
-except ImportError as e:
-    print(f"Error importing required modules: {e}")
-    print("Please ensure all dependencies are installed: pip install -r requirements.txt")
-    sys.exit(1)
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
 
-# Configure logging
+# Configure logging; the automation module is imported lazily, so set up the
+# same log file it would otherwise have configured
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('aci_migration.log'),
+        logging.StreamHandler()
+    ]
 )
 logger = logging.getLogger(__name__)
 
+# APIC responses that reject a bulk polUni POST as a whole (payload too
+# large or schema error) and warrant retrying tenant by tenant
+BULK_FALLBACK_STATUSES = (400, 413)
+
+# The validator reports 'fail' while orchestrator phases report 'failed';
+# CLI exit checks accept either so a failed step always stops the run
+FAILED_STATUSES = ('fail', 'failed')
+
+# A single VLAN ID or an inclusive range such as "100-110" from --vlans
+_VLAN_RE = re.compile(r'^\s*(\d+)(?:\s*-\s*(\d+))?\s*$')
+
+# Tenant files at least this large are mapped instead of read into a buffer
+TENANT_MMAP_THRESHOLD = 1 << 20
+
+
+def _dump_json(obj, path: Path) -> None:
+    """Write obj to path as indented JSON."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        # Results are plain trees, so the cycle check is wasted work
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2, separators=(',', ': '), check_circular=False)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_tenant(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parse a tenant configuration file.
+    
+    Results are cached on (path, mtime_ns, size), so unchanged files are not
+    re-parsed on repeated deploys and an edited file is picked up on its new
+    mtime. The returned dict is shared between callers and must not be mutated.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        if orjson is not None and size >= TENANT_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _loads(f.readall())
+
+
+def _automation():
+    """
+    Import the automation module on first use.
+    
+    The module pulls in the HTTP stack, which phases that never talk to APIC
+    (such as report) shouldn't pay for at startup.
+    """
+    try:
+        import aci_migration_automation
+    except ImportError as e:
+        print(f"Error importing required modules: {e}")
+        print("Please ensure all dependencies are installed: pip install -r requirements.txt")
+        sys.exit(1)
+    return aci_migration_automation
+
+
+class PreflightError(Exception):
+    """Raised when phase inputs fail validation before any APIC change is made."""
+    
+    def __init__(self, problems: List[str]):
+        super().__init__('; '.join(problems))
+        self.problems = problems
+
 
 class MigrationOrchestrator:
     """
@@ -47,15 +133,20 @@ class MigrationOrchestrator:
             config_file (str): Path to migration configuration file
         """
         self.config = self._load_config(config_file)
+        self.output_dir = Path(self.config.get('output_directory', 'migration_output'))
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.aci_connector = None
+        self.async_connector = None
         self.nexus_parser = None
         self.validator = None
+        self._parsed_cache = None
+        self._vlan_to_switches = None
         
     def _load_config(self, config_file: str) -> Dict:
         """Load migration configuration from file."""
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            with open(config_file, 'rb') as f:
+                config = _loads(f.read())
             logger.info(f"Loaded configuration from {config_file}")
             return config
         except Exception as e:
@@ -71,24 +162,20 @@ class MigrationOrchestrator:
         """
         try:
             # Initialize ACI connector
-            apic_config = self.config['apic']
-            self.aci_connector = ACIConnector(
-                apic_ip=apic_config['ip'],
-                username=apic_config['username'],
-                password=apic_config['password'],
-                verify_ssl=apic_config.get('verify_ssl', False)
-            )
+            self.aci_connector = self._create_aci_connector()
             
             if not self.aci_connector.authenticate():
                 logger.error("Failed to authenticate with APIC")
                 return False
             
-            # Initialize Nexus parser
-            nexus_config_dir = self.config['nexus']['config_directory']
-            self.nexus_parser = NexusConfigParser(nexus_config_dir)
+            # Initialize Nexus parser; configs are parsed on first use, so
+            # phases that never read them don't pay for the parse
+            self.nexus_parser = _automation().NexusConfigParser(self.config['nexus']['config_directory'])
             
             # Initialize validator
-            self.validator = MigrationValidator(self.aci_connector, self.nexus_parser)
+            self.validator = _automation().MigrationValidator(
+                self.aci_connector, self.nexus_parser, self.config['aci'].get('mapping_file')
+            )
             
             logger.info("Successfully initialized all connections")
             return True
@@ -97,6 +184,22 @@ class MigrationOrchestrator:
             logger.error(f"Error initializing connections: {e}")
             return False
     
+    def _create_aci_connector(self) -> 'ACIConnector':
+        """Create the APIC connector from the 'apic' configuration section."""
+        apic_config = self.config['apic']
+        return _automation().ACIConnector(
+            apic_ip=apic_config['ip'],
+            username=apic_config['username'],
+            password=apic_config['password'],
+            verify_ssl=apic_config.get('verify_ssl', False),
+            pool_size=self._apic_pool_size()
+        )
+    
+    def _apic_pool_size(self) -> int:
+        """Size the APIC connection pool so no deploy worker waits for a connection."""
+        workers = max(self.config.get('max_parallel_tenants', 8), self.config.get('epg_workers', 8))
+        return self.config['apic'].get('pool_size', max(32, workers))
+    
     def run_pre_migration_checks(self) -> Dict:
         """
         Execute comprehensive pre-migration validation.
@@ -112,16 +215,12 @@ class MigrationOrchestrator:
         results = self.validator.pre_migration_check()
         
         # Save results
-        output_dir = Path(self.config.get('output_directory', 'migration_output'))
-        output_dir.mkdir(exist_ok=True)
-        
-        results_file = output_dir / 'pre_migration_results.json'
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        results_file = self.output_dir / 'pre_migration_results.json'
+        _dump_json(results, results_file)
         
         # Generate report
-        report_file = output_dir / 'pre_migration_report.md'
-        generate_migration_report(results, str(report_file))
+        report_file = self.output_dir / 'pre_migration_report.md'
+        _automation().generate_migration_report(results, str(report_file))
         
         return results
     
@@ -139,12 +238,16 @@ class MigrationOrchestrator:
         
         results = {
             'phase': phase,
-            'timestamp': str(Path(__file__).stat().st_mtime),
+            'timestamp': datetime.now().isoformat(),
             'deployments': {},
             'overall_status': 'unknown'
         }
         
         try:
+            # Reject bad tenant files before anything is pushed to APIC
+            if phase in ['tenants', 'all']:
+                self._preflight([], self._tenant_files(self._tenant_configs_dir()))
+            
             if phase in ['fabric', 'all']:
                 results['deployments']['fabric'] = self._deploy_fabric_configuration()
             
@@ -152,11 +255,13 @@ class MigrationOrchestrator:
                 results['deployments']['tenants'] = self._deploy_tenant_configurations()
             
             # Determine overall status
-            failed_deployments = [
-                name for name, result in results['deployments'].items() 
-                if result.get('status') == 'failed'
-            ]
-            results['overall_status'] = 'failed' if failed_deployments else 'success'
+            results['overall_status'] = self._overall_status(results['deployments'])
+        
+        except PreflightError as e:
+            logger.error(f"Deployment preflight failed: {e}")
+            results['overall_status'] = 'failed'
+            results['error'] = str(e)
+            results['preflight_errors'] = e.problems
             
         except Exception as e:
             logger.error(f"Error during deployment: {e}")
@@ -165,6 +270,15 @@ class MigrationOrchestrator:
         
         return results
     
+    @staticmethod
+    def _overall_status(deployments: Dict) -> str:
+        """Overall deployment status: 'failed' if any deployment failed."""
+        failed_deployments = [
+            name for name, result in deployments.items() 
+            if result.get('status') == 'failed'
+        ]
+        return 'failed' if failed_deployments else 'success'
+    
     def _deploy_fabric_configuration(self) -> Dict:
         """Deploy fabric-level configuration."""
         logger.info("Deploying fabric configuration")
@@ -181,32 +295,177 @@ class MigrationOrchestrator:
         """Deploy tenant configurations."""
         logger.info("Deploying tenant configurations")
         
+        results, tenants = self._load_tenants()
+        if not tenants:
+            return results
+        
+        # Ship every tenant under one polUni so the whole set costs a single
+        # APIC roundtrip
+        status_code = self.aci_connector.create_tenants_bulk([t[2] for t in tenants])
+        
+        if status_code in BULK_FALLBACK_STATUSES:
+            # Payload too large or rejected as a whole; deploy one by one so
+            # a single bad tenant doesn't fail the rest
+            logger.warning(f"Bulk tenant deployment rejected (HTTP {status_code}), deploying tenants individually")
+            max_workers = self.config.get('max_parallel_tenants', 8)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results.update(executor.map(lambda t: self._deploy_one_tenant(*t), tenants))
+            return results
+        
+        results.update(self._bulk_results(tenants, status_code))
+        return results
+    
+    def _load_tenants(self) -> Tuple[Dict, List[Tuple[str, Path, Dict]]]:
+        """
+        Load every tenant configuration file.
+        
+        Returns:
+            Tuple: Failed results keyed by tenant for files that could not be
+                loaded, and (name, file, config) for every tenant that could
+        """
+        loaded = [self._load_tenant(entry) for entry in self._tenant_files(self._tenant_configs_dir())]
+        
         results = {}
-        tenant_configs_dir = Path(self.config['aci']['tenant_configs_directory'])
+        tenants = []
+        for tenant_name, tenant_file, tenant_config, error in loaded:
+            if error is not None:
+                results[tenant_name] = {'status': 'failed', 'error': error}
+            else:
+                tenants.append((tenant_name, tenant_file, tenant_config))
         
-        for tenant_file in tenant_configs_dir.glob('*.json'):
-            tenant_name = tenant_file.stem
-            logger.info(f"Deploying tenant: {tenant_name}")
-            
-            try:
-                with open(tenant_file, 'r') as f:
-                    tenant_config = json.load(f)
-                
-                success = self.aci_connector.create_tenant(tenant_config)
-                results[tenant_name] = {
-                    'status': 'success' if success else 'failed',
-                    'config_file': str(tenant_file)
-                }
-                
-            except Exception as e:
-                logger.error(f"Error deploying tenant {tenant_name}: {e}")
+        return results, tenants
+    
+    @staticmethod
+    def _bulk_results(tenants: List[Tuple[str, Path, Dict]], status_code: Optional[int]) -> Dict:
+        """Map the outcome of a bulk tenant POST back to per-tenant results."""
+        results = {}
+        for tenant_name, tenant_file, _ in tenants:
+            if status_code in (200, 201):
+                results[tenant_name] = {'status': 'success', 'config_file': str(tenant_file)}
+            else:
                 results[tenant_name] = {
                     'status': 'failed',
-                    'error': str(e)
+                    'config_file': str(tenant_file),
+                    'error': f"Bulk tenant deployment failed (HTTP {status_code})"
                 }
-        
         return results
     
+    def _tenant_configs_dir(self) -> Path:
+        """Return the directory holding tenant configuration files."""
+        return Path(self.config['aci']['tenant_configs_directory'])
+    
+    @staticmethod
+    def _tenant_files(tenant_configs_dir: Path) -> List[os.DirEntry]:
+        """List tenant JSON files in a single directory scan."""
+        with os.scandir(tenant_configs_dir) as entries:
+            return [entry for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()]
+    
+    @staticmethod
+    def _load_tenant(entry: os.DirEntry) -> Tuple[str, Path, Optional[Dict], Optional[str]]:
+        """Load a tenant configuration file, capturing any read or parse error."""
+        tenant_file = Path(entry.path)
+        try:
+            stat = entry.stat()
+            tenant_config = _parse_tenant(entry.path, stat.st_mtime_ns, stat.st_size)
+            return tenant_file.stem, tenant_file, tenant_config, None
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading tenant {tenant_file.stem}: {e}")
+            return tenant_file.stem, tenant_file, None, str(e)
+    
+    def _deploy_one_tenant(self, tenant_name: str, tenant_file: Path, tenant_config: Dict) -> Tuple[str, Dict]:
+        """Deploy a single tenant configuration."""
+        logger.info(f"Deploying tenant: {tenant_name}")
+        
+        try:
+            success = self.aci_connector.create_tenant(tenant_config)
+            return tenant_name, {
+                'status': 'success' if success else 'failed',
+                'config_file': str(tenant_file)
+            }
+        
+        except Exception as e:
+            logger.error(f"Error deploying tenant {tenant_name}: {e}")
+            return tenant_name, {
+                'status': 'failed',
+                'error': str(e)
+            }
+    
+    def _get_parsed_configs(self) -> Dict:
+        """Return parsed Nexus configurations, parsing them on first use."""
+        if self._parsed_cache is None:
+            self._parsed_cache = self.nexus_parser.parse_all_configs()
+        return self._parsed_cache
+    
+    def _get_vlan_index(self) -> Dict[str, List[str]]:
+        """Return the switches defining each VLAN ID, built once per parse."""
+        if self._vlan_to_switches is None:
+            vlan_to_switches = defaultdict(list)
+            for switch, config in self._get_parsed_configs().items():
+                for vlan in config['vlans']:
+                    vlan_to_switches[vlan].append(switch)
+            # Plain dict so lookups of unknown VLANs don't insert empty entries
+            self._vlan_to_switches = dict(vlan_to_switches)
+        return self._vlan_to_switches
+    
+    def refresh_nexus_cache(self):
+        """Discard cached Nexus configurations so the next phase re-parses them."""
+        self._parsed_cache = None
+        self._vlan_to_switches = None
+    
+    def _preflight(self, vlan_list: List[str], tenant_files: List[os.DirEntry]) -> Dict:
+        """
+        Validate phase inputs before any change is made on APIC.
+        
+        Args:
+            vlan_list (List[str]): VLANs that must exist in the Nexus configs
+                and have an EPG mapping
+            tenant_files (List[os.DirEntry]): Tenant files that must parse to
+                an fvTenant object
+        
+        Returns:
+            Dict: VLAN-to-EPG mapping loaded to check vlan_list, empty when no
+                VLANs were given
+        
+        Raises:
+            PreflightError: If any input is invalid, listing every problem found
+        """
+        problems = []
+        mapping = {}
+        
+        if vlan_list:
+            missing = set(vlan_list) - self._get_vlan_index().keys()
+            if missing:
+                missing_vlans = [vlan for vlan in vlan_list if vlan in missing]
+                problems.append(f"VLANs not found in Nexus config: {missing_vlans}")
+            
+            mapping = self.nexus_parser.generate_migration_mapping(str(self.validator.mapping_file()))
+            unmapped = [vlan for vlan in vlan_list if vlan not in missing and vlan not in mapping]
+            if unmapped:
+                problems.append(f"VLANs without an EPG mapping: {unmapped}")
+        
+        for entry in tenant_files:
+            tenant_name, _, tenant_config, error = self._load_tenant(entry)
+            if error is not None:
+                problems.append(f"Tenant {tenant_name}: {error}")
+            elif not self._is_tenant_config(tenant_config):
+                problems.append(f"Tenant {tenant_name}: expected an fvTenant object with a name attribute")
+        
+        if problems:
+            raise PreflightError(problems)
+        
+        return mapping
+    
+    @staticmethod
+    def _is_tenant_config(tenant_config) -> bool:
+        """Check that a tenant file holds a named fvTenant object."""
+        if not isinstance(tenant_config, dict) or set(tenant_config) != {'fvTenant'}:
+            return False
+        tenant = tenant_config['fvTenant']
+        if not isinstance(tenant, dict) or not isinstance(tenant.get('attributes'), dict):
+            return False
+        return bool(tenant['attributes'].get('name'))
+    
     def run_migration_phase(self, phase_name: str, vlan_list: List[str]) -> Dict:
         """
         Execute a specific migration phase.
@@ -223,38 +482,41 @@ class MigrationOrchestrator:
         results = {
             'phase_name': phase_name,
             'vlans': vlan_list,
-            'timestamp': str(Path(__file__).stat().st_mtime),
+            'timestamp': datetime.now().isoformat(),
             'status': 'unknown',
             'details': {}
         }
         
         try:
-            # Validate VLANs exist in Nexus configuration
-            parsed_configs = self.nexus_parser.parse_all_configs()
-            all_nexus_vlans = set()
-            for config in parsed_configs.values():
-                all_nexus_vlans.update(config['vlans'].keys())
+            # Validate VLANs exist in Nexus configuration and have an EPG
+            # mapping before any EPG is pushed to APIC
+            mapping = self._preflight(vlan_list, [])
+            vlan_index = self._get_vlan_index()
             
-            missing_vlans = [vlan for vlan in vlan_list if vlan not in all_nexus_vlans]
-            if missing_vlans:
-                results['status'] = 'failed'
-                results['details']['error'] = f"VLANs not found in Nexus config: {missing_vlans}"
-                return results
+            # Leaf switches carrying each VLAN, so later steps can scope
+            # EPG bindings to them instead of the whole fabric
+            results['details']['affected_switches'] = {vlan: vlan_index[vlan] for vlan in vlan_list}
             
             # Deploy corresponding EPGs for VLANs
-            # This is a simplified implementation
-            results['details']['epg_deployment'] = {
-                'attempted': len(vlan_list),
-                'successful': len(vlan_list),  # Assuming success for now
-                'failed': 0
-            }
+            epg_deployment = self._deploy_epgs(vlan_list, mapping)
+            results['details']['epg_deployment'] = epg_deployment
             
             # Run post-migration validation
-            validation_results = self.validator.post_migration_validation(vlan_list)
+            validation_results = self.validator.post_migration_validation(vlan_list, mapping)
             results['details']['validation'] = validation_results
             
-            results['status'] = 'success'
-            logger.info(f"Migration phase {phase_name} completed successfully")
+            if epg_deployment['failed']:
+                results['status'] = 'failed'
+                logger.error(f"Migration phase {phase_name} failed to deploy {epg_deployment['failed']} EPGs")
+            else:
+                results['status'] = 'success'
+                logger.info(f"Migration phase {phase_name} completed successfully")
+        
+        except PreflightError as e:
+            logger.error(f"Migration phase {phase_name} preflight failed: {e}")
+            results['status'] = 'failed'
+            results['details']['error'] = str(e)
+            results['details']['preflight_errors'] = e.problems
             
         except Exception as e:
             logger.error(f"Error in migration phase {phase_name}: {e}")
@@ -263,6 +525,73 @@ class MigrationOrchestrator:
         
         return results
     
+    def _deploy_epgs(self, vlan_list: List[str], mapping: Dict) -> Dict:
+        """
+        Deploy the EPG mapped to each VLAN from a shared work queue.
+        
+        Args:
+            vlan_list (List[str]): VLANs whose EPGs should be deployed
+            mapping (Dict): VLAN-to-EPG mapping covering every VLAN in vlan_list
+        
+        Returns:
+            Dict: Attempted, successful and failed counts, plus the error for
+                each VLAN whose EPG could not be deployed
+        """
+        work = queue.Queue()
+        for vlan in vlan_list:
+            work.put(vlan)
+        
+        outcomes = []
+        lock = threading.Lock()
+        
+        def worker():
+            while True:
+                try:
+                    vlan = work.get_nowait()
+                except queue.Empty:
+                    return
+                ok, error = self._deploy_epg(vlan, mapping.get(vlan))
+                with lock:
+                    outcomes.append((vlan, ok, error))
+        
+        # EPG POSTs are independent, so N workers drain the queue in about
+        # ceil(VLANs / N) roundtrips
+        num_workers = min(max(self.config.get('epg_workers', 8), 1), len(vlan_list))
+        workers = [threading.Thread(target=worker) for _ in range(num_workers)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        
+        errors = {vlan: error for vlan, ok, error in outcomes if not ok}
+        return {
+            'attempted': len(vlan_list),
+            'successful': len(outcomes) - len(errors),
+            'failed': len(errors),
+            'errors': errors
+        }
+    
+    def _deploy_epg(self, vlan: str, epg_mapping: Optional[Dict]) -> Tuple[bool, Optional[str]]:
+        """Deploy the EPG for one VLAN, returning success and an error message."""
+        if epg_mapping is None:
+            return False, 'No EPG mapping found for VLAN'
+        
+        try:
+            created = self.aci_connector.create_epg(
+                tenant=epg_mapping['tenant'],
+                app_profile=epg_mapping['app_profile'],
+                epg=epg_mapping['epg'],
+                bridge_domain=epg_mapping['bridge_domain'],
+                description=f"Migrated from Nexus VLAN {vlan}"
+            )
+            if created:
+                return True, None
+            return False, f"APIC rejected EPG {epg_mapping['epg']}"
+        
+        except Exception as e:
+            logger.error(f"Error deploying EPG for VLAN {vlan}: {e}")
+            return False, str(e)
+    
     def generate_final_report(self) -> str:
         """
         Generate comprehensive final migration report.
@@ -272,31 +601,29 @@ class MigrationOrchestrator:
         """
         logger.info("Generating final migration report")
         
-        output_dir = Path(self.config.get('output_directory', 'migration_output'))
-        output_dir.mkdir(exist_ok=True)
-        
-        report_file = output_dir / 'final_migration_report.md'
+        report_file = self.output_dir / 'final_migration_report.md'
         
         # Collect all migration artifacts
-        report_content = [
-            "# Final Migration Report",
-            f"Generated: {str(Path(__file__).stat().st_mtime)}",
-            "",
-            "## Migration Summary",
-            "This report summarizes the complete migration from Nexus to ACI.",
-            "",
-            "## Configuration Files Used",
-            f"- Nexus configs: {self.config['nexus']['config_directory']}",
-            f"- ACI configs: {self.config['aci']['tenant_configs_directory']}",
-            "",
-            "## Migration Results",
-            "Detailed results are available in individual phase reports.",
-            "",
-        ]
+        nexus_config_dir = self.config['nexus']['config_directory']
+        tenant_configs_dir = self.config['aci']['tenant_configs_directory']
         
         try:
-            with open(report_file, 'w') as f:
-                f.write('\n'.join(report_content))
+            # Write straight to a large file buffer rather than joining the
+            # report in memory first
+            with open(report_file, 'w', buffering=1 << 16) as f:
+                write = f.write
+                write("# Final Migration Report\n")
+                write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                write("\n")
+                write("## Migration Summary\n")
+                write("This report summarizes the complete migration from Nexus to ACI.\n")
+                write("\n")
+                write("## Configuration Files Used\n")
+                write(f"- Nexus configs: {nexus_config_dir}\n")
+                write(f"- ACI configs: {tenant_configs_dir}\n")
+                write("\n")
+                write("## Migration Results\n")
+                write("Detailed results are available in individual phase reports.\n")
             logger.info(f"Final report generated: {report_file}")
             return str(report_file)
             
@@ -304,6 +631,224 @@ class MigrationOrchestrator:
             logger.error(f"Error generating final report: {e}")
             raise
 
+    async def ainitialize_connections(self) -> bool:
+        """
+        Initialize connections asynchronously through AsyncACIConnector.
+        
+        The APIC login runs on the event loop while the Nexus parse runs in a
+        worker thread. The synchronous connector used by the validator then
+        picks the token up from the shared token cache without a second login.
+        
+        Returns:
+            bool: True if initialization successful
+        """
+        try:
+            apic_config = self.config['apic']
+            self.async_connector = _automation().AsyncACIConnector(
+                apic_ip=apic_config['ip'],
+                username=apic_config['username'],
+                password=apic_config['password'],
+                verify_ssl=apic_config.get('verify_ssl', False),
+                max_connections=self._apic_pool_size()
+            )
+            
+            if not await self.async_connector.authenticate():
+                logger.error("Failed to authenticate with APIC")
+                return False
+            
+            # Pre-checks and the EPG workers still use the synchronous connector
+            self.aci_connector = self._create_aci_connector()
+            if not self.aci_connector.authenticate():
+                logger.error("Failed to authenticate with APIC")
+                return False
+            
+            self.nexus_parser = _automation().NexusConfigParser(self.config['nexus']['config_directory'])
+            self.validator = _automation().MigrationValidator(
+                self.aci_connector, self.nexus_parser, self.config['aci'].get('mapping_file')
+            )
+            
+            logger.info("Successfully initialized all connections")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error initializing connections: {e}")
+            return False
+    
+    def close(self) -> None:
+        """Release the APIC connections held by the synchronous connector."""
+        if self.aci_connector:
+            self.aci_connector.close()
+    
+    async def aclose(self) -> None:
+        """Release the APIC connections held by the connectors."""
+        if self.async_connector:
+            await self.async_connector.close()
+        self.close()
+    
+    async def adeploy_aci_configuration(self, phase: str = 'all') -> Dict:
+        """
+        Deploy ACI configuration asynchronously.
+        
+        Args:
+            phase (str): Migration phase ('fabric', 'tenants', 'all')
+        
+        Returns:
+            Dict: Deployment results
+        """
+        logger.info(f"Starting ACI configuration deployment - Phase: {phase}")
+        
+        results = {
+            'phase': phase,
+            'timestamp': datetime.now().isoformat(),
+            'deployments': {},
+            'overall_status': 'unknown'
+        }
+        
+        try:
+            if phase in ['tenants', 'all']:
+                self._preflight([], self._tenant_files(self._tenant_configs_dir()))
+            
+            if phase in ['fabric', 'all']:
+                results['deployments']['fabric'] = self._deploy_fabric_configuration()
+            
+            if phase in ['tenants', 'all']:
+                results['deployments']['tenants'] = await self.adeploy_tenant_configurations()
+            
+            results['overall_status'] = self._overall_status(results['deployments'])
+        
+        except PreflightError as e:
+            logger.error(f"Deployment preflight failed: {e}")
+            results['overall_status'] = 'failed'
+            results['error'] = str(e)
+            results['preflight_errors'] = e.problems
+        
+        except Exception as e:
+            logger.error(f"Error during deployment: {e}")
+            results['overall_status'] = 'failed'
+            results['error'] = str(e)
+        
+        return results
+    
+    async def adeploy_tenant_configurations(self) -> Dict:
+        """Deploy tenant configurations on the event loop."""
+        logger.info("Deploying tenant configurations")
+        
+        results, tenants = self._load_tenants()
+        if not tenants:
+            return results
+        
+        status_code = await self.async_connector.create_tenants_bulk([t[2] for t in tenants])
+        
+        if status_code not in BULK_FALLBACK_STATUSES:
+            results.update(self._bulk_results(tenants, status_code))
+            return results
+        
+        logger.warning(f"Bulk tenant deployment rejected (HTTP {status_code}), deploying tenants individually")
+        semaphore = asyncio.Semaphore(self.config.get('max_parallel_tenants', 8))
+        
+        async def deploy_one(tenant_name: str, tenant_config: Dict) -> bool:
+            async with semaphore:
+                logger.info(f"Deploying tenant: {tenant_name}")
+                return await self.async_connector.create_tenant(tenant_config)
+        
+        outcomes = await asyncio.gather(
+            *(deploy_one(tenant_name, tenant_config) for tenant_name, _, tenant_config in tenants),
+            return_exceptions=True
+        )
+        
+        for (tenant_name, tenant_file, _), outcome in zip(tenants, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error deploying tenant {tenant_name}: {outcome}")
+                results[tenant_name] = {'status': 'failed', 'error': str(outcome)}
+            else:
+                results[tenant_name] = {
+                    'status': 'success' if outcome else 'failed',
+                    'config_file': str(tenant_file)
+                }
+        
+        return results
+    
+    async def arun_migration_phase(self, phase_name: str, vlan_list: List[str]) -> Dict:
+        """Run a migration phase in a worker thread without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.run_migration_phase, phase_name, vlan_list)
+
+
+def _parse_vlans(vlan_spec: str) -> List[str]:
+    """
+    Expand a comma-separated list of VLAN IDs and ranges.
+    
+    Args:
+        vlan_spec (str): VLANs such as "10,20,100-110"
+    
+    Returns:
+        List[str]: VLAN IDs in the order given, without duplicates
+    
+    Raises:
+        ValueError: If any entry is not a valid VLAN ID (1-4094) or range
+    """
+    vlans = []
+    invalid = []
+    
+    for token in vlan_spec.split(','):
+        match = _VLAN_RE.fullmatch(token)
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2) or start)
+        if not match or not 1 <= start <= end <= 4094:
+            invalid.append(token.strip())
+            continue
+        vlans.extend(str(vlan) for vlan in range(start, end + 1))
+    
+    if invalid:
+        raise ValueError(f"Invalid VLAN entries: {invalid}")
+    return list(dict.fromkeys(vlans))
+
+
+def run(args: argparse.Namespace, vlan_list: List[str]):
+    """Run the requested phase with the synchronous orchestrator."""
+    orchestrator = MigrationOrchestrator(args.config)
+    
+    # The final report is built from local state only
+    if args.phase == 'report':
+        return orchestrator.generate_final_report()
+    
+    try:
+        if not orchestrator.initialize_connections():
+            logger.error("Failed to initialize connections")
+            sys.exit(1)
+    
+        if args.phase == 'pre-check':
+            return orchestrator.run_pre_migration_checks()
+        elif args.phase == 'deploy':
+            return orchestrator.deploy_aci_configuration()
+        return orchestrator.run_migration_phase('manual', vlan_list)
+    
+    finally:
+        orchestrator.close()
+
+
+async def amain(args: argparse.Namespace, vlan_list: List[str]):
+    """Run the requested phase with APIC I/O on an asyncio event loop."""
+    orchestrator = MigrationOrchestrator(args.config)
+    
+    if args.phase == 'report':
+        return orchestrator.generate_final_report()
+    
+    try:
+        if not await orchestrator.ainitialize_connections():
+            logger.error("Failed to initialize connections")
+            sys.exit(1)
+        
+        if args.phase == 'pre-check':
+            return orchestrator.run_pre_migration_checks()
+        elif args.phase == 'deploy':
+            return await orchestrator.adeploy_aci_configuration()
+        return await orchestrator.arun_migration_phase('manual', vlan_list)
+    
+    finally:
+        await orchestrator.aclose()
+
 
 def main():
     """Main entry point for migration orchestrator."""
@@ -312,49 +857,53 @@ def main():
     parser.add_argument('--phase', choices=['pre-check', 'deploy', 'migrate', 'report'], 
                         default='pre-check', help='Migration phase to execute')
     parser.add_argument('--vlans', help='Comma-separated list of VLANs to migrate (for migrate phase)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="Drive APIC requests from an asyncio event loop (requires httpx)")
     
     args = parser.parse_args()
     
-    try:
-        orchestrator = MigrationOrchestrator(args.config)
-        
-        if not orchestrator.initialize_connections():
-            logger.error("Failed to initialize connections")
+    vlan_list = []
+    if args.phase == 'migrate':
+        if not args.vlans:
+            logger.error("VLANs list required for migrate phase")
             sys.exit(1)
         
+        # Reject typos before any connection to APIC is made
+        try:
+            vlan_list = _parse_vlans(args.vlans)
+        except ValueError as e:
+            logger.error(str(e))
+            sys.exit(2)
+    
+    try:
+        if args.use_async:
+            results = asyncio.run(amain(args, vlan_list))
+        else:
+            results = run(args, vlan_list)
+        
         if args.phase == 'pre-check':
-            results = orchestrator.run_pre_migration_checks()
-            if results['overall_status'] == 'fail':
+            if results.get('overall_status') in FAILED_STATUSES:
                 logger.error("Pre-migration checks failed. Review results before proceeding.")
                 sys.exit(1)
             else:
                 logger.info("Pre-migration checks passed successfully")
         
         elif args.phase == 'deploy':
-            results = orchestrator.deploy_aci_configuration()
-            if results['overall_status'] == 'failed':
+            if results.get('overall_status') in FAILED_STATUSES:
                 logger.error("ACI configuration deployment failed")
                 sys.exit(1)
             else:
                 logger.info("ACI configuration deployed successfully")
         
         elif args.phase == 'migrate':
-            if not args.vlans:
-                logger.error("VLANs list required for migrate phase")
-                sys.exit(1)
-            
-            vlan_list = [vlan.strip() for vlan in args.vlans.split(',')]
-            results = orchestrator.run_migration_phase('manual', vlan_list)
-            
-            if results['status'] == 'failed':
+            if results.get('status') in FAILED_STATUSES:
                 logger.error("Migration phase failed")
                 sys.exit(1)
             else:
                 logger.info("Migration phase completed successfully")
         
         elif args.phase == 'report':
-            report_file = orchestrator.generate_final_report()
-            logger.info(f"Final report generated: {report_file}")
+            logger.info(f"Final report generated: {results}")
         
     except Exception as e:
         logger.error(f"Migration orchestrator error: {e}")
@@ -362,4 +911,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
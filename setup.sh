@@ -62,7 +62,8 @@ cat > migration_config.json << EOF
     "config_directory": "configs/nexus/current-state"
   },
   "aci": {
-    "tenant_configs_directory": "configs/aci/tenant-configs"
+    "tenant_configs_directory": "configs/aci/tenant-configs",
+    "mapping_file": "configs/aci/migration-mappings/vlan-to-epg-mapping.csv"
   },
   "output_directory": "migration_output",
   "backup_directory": "backups",
@@ -0,0 +1,67 @@
+"""Tests for the migration orchestrator command line entry point."""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+
+@pytest.fixture
+def orchestrator(monkeypatch, tmp_path):
+    """Import the orchestrator from a scratch directory, where it opens its log file."""
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module('migrate_orchestrator')
+
+
+def run_main(monkeypatch, orchestrator, phase, results, *extra_args):
+    """Run main() for a phase with run() stubbed to return the given results."""
+    monkeypatch.setattr(orchestrator, 'run', lambda args, vlan_list: results)
+    monkeypatch.setattr(sys, 'argv', ['migrate_orchestrator.py', '--config', 'config.json',
+                                      '--phase', phase, *extra_args])
+    orchestrator.main()
+
+
+@pytest.mark.parametrize('status', ['fail', 'failed'])
+def test_pre_check_failure_exits_early(monkeypatch, orchestrator, status):
+    with pytest.raises(SystemExit) as excinfo:
+        run_main(monkeypatch, orchestrator, 'pre-check', {'overall_status': status})
+    assert excinfo.value.code == 1
+
+
+def test_pre_check_success_does_not_exit(monkeypatch, orchestrator):
+    run_main(monkeypatch, orchestrator, 'pre-check', {'overall_status': 'pass'})
+
+
+def test_deploy_failure_exits(monkeypatch, orchestrator):
+    with pytest.raises(SystemExit) as excinfo:
+        run_main(monkeypatch, orchestrator, 'deploy', {'overall_status': 'failed'})
+    assert excinfo.value.code == 1
+
+
+def test_migrate_failure_exits(monkeypatch, orchestrator):
+    with pytest.raises(SystemExit) as excinfo:
+        run_main(monkeypatch, orchestrator, 'migrate', {'status': 'failed'}, '--vlans', '10')
+    assert excinfo.value.code == 1
+
+
+def test_run_closes_connector_when_initialization_fails(monkeypatch, orchestrator):
+    closed = []
+    
+    class FailingOrchestrator(orchestrator.MigrationOrchestrator):
+        def __init__(self, config_file):
+            self.aci_connector = None
+        
+        def initialize_connections(self):
+            return False
+        
+        def close(self):
+            closed.append(True)
+    
+    monkeypatch.setattr(orchestrator, 'MigrationOrchestrator', FailingOrchestrator)
+    args = orchestrator.argparse.Namespace(config='config.json', phase='pre-check')
+    with pytest.raises(SystemExit):
+        orchestrator.run(args, [])
+    assert closed == [True]